@@ -2,112 +2,258 @@
 Reminder notification endpoints for Ava AI Voice Assistant
 """
 import asyncio
+import sys
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from ..database.service import DatabaseService
-from ..database.models import Reminder, ReminderCreate, ReminderUpdate
+from pathlib import Path
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
 import logging
 
+# Add the parent directory to Python path to resolve imports
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from config import Config
+from database.service import DatabaseService, DAY_NAMES, db_service
+from database.models import MedicationLogCreate, Reminder, ReminderCreate, ReminderUpdate
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/reminders", tags=["reminders"])
 
-# Global reminder monitoring state
-reminder_monitor_running = False
-reminder_monitor_task = None
+DEFAULT_USER_ID = "00000000-0000-0000-0000-000000000001"
+
+def get_db() -> DatabaseService:
+    """Shared DatabaseService; constructing one per request/tick would
+    re-run the Supabase client setup and connection test each time"""
+    return db_service
+
+# Global reminder monitoring state: one shared loop covers every user's
+# reminders, so adding users doesn't add monitor tasks
+reminder_monitor_task: Optional[asyncio.Task] = None
+reminder_monitor_stop_event: Optional[asyncio.Event] = None
+
+# Set whenever reminders change so the monitor can recompute its wakeup
+# time. Created lazily: on Python 3.8/3.9 (the documented minimum is 3.8)
+# asyncio primitives bind an event loop at construction, so building the
+# Event at import would pin whatever loop happened to be current then
+reminders_changed: Optional[asyncio.Event] = None
+
+def reminders_changed_event() -> asyncio.Event:
+    """Get the shared change event, creating it on first use"""
+    global reminders_changed
+    if reminders_changed is None:
+        reminders_changed = asyncio.Event()
+    return reminders_changed
+
+def notify_reminders_changed(user_id: Optional[str] = None):
+    """Drop stale cached lists and wake the monitor after a write.
+
+    main.py's legacy /api/reminders handlers write reminders without
+    going through this router, so they call this to get the same cache
+    invalidation and reschedule behaviour as the router's own endpoints.
+    user_id=None clears every cached list (for writes whose owner is
+    unknown, like deletes).
+    """
+    invalidate_reminder_cache(user_id)
+    reminders_changed_event().set()
+
+# Heartbeat cap: never sleep longer than this, even with no upcoming reminder
+MONITOR_REFRESH_SECONDS = 300
+
+# Yield to the event loop after this many reminders in a batch scan
+YIELD_EVERY_N_REMINDERS = 100
+
+# Strong references to fire-and-forget tasks so the event loop can't
+# garbage-collect them mid-flight
+_background_tasks: set = set()
+
+def _on_background_task_done(task: asyncio.Task):
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.error("Background task %s failed: %s", task.get_name(), exc)
+
+def spawn_background_task(coro, name: Optional[str] = None) -> asyncio.Task:
+    """Create a task that is kept referenced and logged if it fails"""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_task_done)
+    return task
+
+# Medication log writes are queued and flushed off the request path;
+# created lazily for the same loop-binding reason as reminders_changed
+_medication_log_queue: Optional[asyncio.Queue] = None
+
+def medication_log_queue() -> asyncio.Queue:
+    """Get the shared log queue, creating it on first use"""
+    global _medication_log_queue
+    if _medication_log_queue is None:
+        _medication_log_queue = asyncio.Queue()
+    return _medication_log_queue
+
+async def medication_log_worker():
+    """Drain queued medication logs into the database"""
+    db = get_db()
+    queue = medication_log_queue()
+    while True:
+        log_data = await queue.get()
+        try:
+            await db.create_medication_log(log_data)
+            logger.info("Medication log created for medication %s", log_data.medication_id)
+        except Exception as log_error:
+            logger.warning("Failed to create medication log: %s", log_error)
+        finally:
+            queue.task_done()
+
+# Memoized day-name sets; most reminders share the same few schedules
+_days_of_week_sets: Dict[tuple, frozenset] = {}
+
+def days_of_week_set(days: List[str]) -> frozenset:
+    """Get a frozenset for O(1) day membership checks"""
+    key = tuple(days)
+    cached = _days_of_week_sets.get(key)
+    if cached is None:
+        cached = _days_of_week_sets[key] = frozenset(days)
+    return cached
+
+# Short-TTL cache of active reminder lists, keyed by user_id.
+# Entries are (monotonic fetch time, reminders); writes invalidate explicitly.
+REMINDER_CACHE_TTL_SECONDS = 30
+_reminder_cache: dict = {}
+
+async def get_cached_reminders(db: DatabaseService, user_id: Optional[str] = None) -> List[Reminder]:
+    """Get active reminders served from cache within the TTL.
+
+    user_id=None is the shared all-users list the monitor runs on.
+    """
+    cached = _reminder_cache.get(user_id)
+    if cached and time.monotonic() - cached[0] < REMINDER_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    reminders = await db.get_reminders(user_id, active_only=True)
+    _reminder_cache[user_id] = (time.monotonic(), reminders)
+    return reminders
+
+def invalidate_reminder_cache(user_id: Optional[str] = None):
+    """Drop cached lists after a write; None clears everything"""
+    if user_id is None:
+        _reminder_cache.clear()
+    else:
+        _reminder_cache.pop(user_id, None)
+        # The shared all-users list is stale too
+        _reminder_cache.pop(None, None)
+
+async def filter_due_reminders(reminders: List[Reminder], now: datetime) -> List[Reminder]:
+    """Batch due-check with the per-pass invariants hoisted out of the loop"""
+    current_minutes = now.hour * 60 + now.minute
+    current_day = DAY_NAMES[now.weekday()]
+
+    due_reminders = []
+    for index, reminder in enumerate(reminders, start=1):
+        if is_reminder_due(reminder, now, current_minutes, current_day):
+            due_reminders.append(reminder)
+        # Don't starve the event loop while scanning a large batch
+        if index % YIELD_EVERY_N_REMINDERS == 0:
+            await asyncio.sleep(0)
+    return due_reminders
 
 @router.get("/", response_model=List[Reminder])
 async def get_reminders(
-    user_id: str = "00000000-0000-0000-0000-000000000001",
+    user_id: str = DEFAULT_USER_ID,
     active_only: bool = True,
-    db: DatabaseService = Depends(DatabaseService)
+    limit: int = Query(100, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    since: Optional[datetime] = None,
+    db: DatabaseService = Depends(get_db)
 ):
-    """Get user reminders"""
+    """Get user reminders (paginated, optionally created since a moment)"""
     try:
-        reminders = await db.get_reminders(user_id, active_only)
+        reminders = await db.get_reminders(user_id, active_only, limit=limit, offset=offset, since=since)
         return reminders
     except Exception as e:
-        logger.error(f"Error getting reminders: {e}")
+        logger.error("Error getting reminders: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/", response_model=Reminder)
 async def create_reminder(
     reminder: ReminderCreate,
-    db: DatabaseService = Depends(DatabaseService)
+    db: DatabaseService = Depends(get_db)
 ):
     """Create a new reminder"""
     try:
-        new_reminder = await db.add_reminder(reminder)
+        new_reminder = await db.create_reminder(reminder)
+        notify_reminders_changed(reminder.user_id)
         return new_reminder
     except Exception as e:
-        logger.error(f"Error creating reminder: {e}")
+        logger.error("Error creating reminder: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{reminder_id}", response_model=Reminder)
 async def update_reminder(
     reminder_id: str,
     reminder_update: ReminderUpdate,
-    db: DatabaseService = Depends(DatabaseService)
+    db: DatabaseService = Depends(get_db)
 ):
     """Update a reminder"""
     try:
         updated_reminder = await db.update_reminder(reminder_id, reminder_update)
         if not updated_reminder:
             raise HTTPException(status_code=404, detail="Reminder not found")
+        notify_reminders_changed(updated_reminder.user_id)
         return updated_reminder
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error updating reminder: {e}")
+        logger.error("Error updating reminder: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{reminder_id}")
 async def delete_reminder(
     reminder_id: str,
-    db: DatabaseService = Depends(DatabaseService)
+    db: DatabaseService = Depends(get_db)
 ):
     """Delete a reminder"""
     try:
         success = await db.delete_reminder(reminder_id)
         if not success:
             raise HTTPException(status_code=404, detail="Reminder not found")
+        # Delete only returns success, so we don't know the owner
+        notify_reminders_changed()
         return {"message": "Reminder deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error deleting reminder: {e}")
+        logger.error("Error deleting reminder: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/due", response_model=List[Reminder])
 async def get_due_reminders(
-    user_id: str = "00000000-0000-0000-0000-000000000001",
-    db: DatabaseService = Depends(DatabaseService)
+    user_id: str = DEFAULT_USER_ID,
+    db: DatabaseService = Depends(get_db)
 ):
     """Get reminders that are currently due"""
     try:
         now = datetime.now()
-        current_time = now.strftime("%H:%M")
-        current_day = now.strftime("%A")
-        
-        # Get all active reminders
-        all_reminders = await db.get_reminders(user_id, active_only=True)
-        
-        due_reminders = []
-        for reminder in all_reminders:
-            if is_reminder_due(reminder, current_time, current_day):
-                due_reminders.append(reminder)
-        
+
+        # Filtering happens in the database; filter_due_reminders is kept
+        # as a defensive post-check
+        candidates = await db.get_due_reminders(user_id, now)
+        due_reminders = await filter_due_reminders(candidates, now)
+
         return due_reminders
     except Exception as e:
-        logger.error(f"Error getting due reminders: {e}")
+        logger.error("Error getting due reminders: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{reminder_id}/snooze")
 async def snooze_reminder(
     reminder_id: str,
-    minutes: int = 5,
-    db: DatabaseService = Depends(DatabaseService)
+    minutes: int = Query(5, ge=1, le=1440),
+    db: DatabaseService = Depends(get_db)
 ):
     """Snooze a reminder for specified minutes"""
     try:
@@ -120,7 +266,8 @@ async def snooze_reminder(
         updated_reminder = await db.update_reminder(reminder_id, reminder_update)
         if not updated_reminder:
             raise HTTPException(status_code=404, detail="Reminder not found")
-        
+        notify_reminders_changed(updated_reminder.user_id)
+
         return {
             "message": f"Reminder snoozed for {minutes} minutes",
             "snooze_until": snooze_until.isoformat()
@@ -128,14 +275,14 @@ async def snooze_reminder(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error snoozing reminder: {e}")
+        logger.error("Error snoozing reminder: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{reminder_id}/complete")
 async def complete_reminder(
     reminder_id: str,
     medication_id: Optional[str] = None,
-    db: DatabaseService = Depends(DatabaseService)
+    db: DatabaseService = Depends(get_db)
 ):
     """Mark a reminder as completed for today"""
     try:
@@ -149,24 +296,19 @@ async def complete_reminder(
         updated_reminder = await db.update_reminder(reminder_id, reminder_update)
         if not updated_reminder:
             raise HTTPException(status_code=404, detail="Reminder not found")
-        
-        # If it's a medication reminder, log it
+        notify_reminders_changed(updated_reminder.user_id)
+
+        # If it's a medication reminder, queue the log write so the
+        # response doesn't wait on it
         if medication_id:
-            try:
-                from ..database.models import MedicationLogCreate
-                
-                log_data = MedicationLogCreate(
-                    user_id=updated_reminder.user_id,
-                    medication_id=medication_id,
-                    taken_at=now,
-                    scheduled_time=now.strftime("%H:%M"),
-                    status="taken"
-                )
-                
-                await db.add_medication_log(log_data)
-                logger.info(f"Medication log created for reminder {reminder_id}")
-            except Exception as log_error:
-                logger.warning(f"Failed to create medication log: {log_error}")
+            log_data = MedicationLogCreate(
+                user_id=updated_reminder.user_id,
+                medication_id=medication_id,
+                taken_at=now,
+                scheduled_time=f"{now.hour:02d}:{now.minute:02d}",
+                status="taken"
+            )
+            medication_log_queue().put_nowait(log_data)
         
         return {
             "message": "Reminder marked as completed",
@@ -175,127 +317,249 @@ async def complete_reminder(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error completing reminder: {e}")
+        logger.error("Error completing reminder: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
+async def monitor_reminders(check_interval: int = 60,
+                            stop_event: Optional[asyncio.Event] = None):
+    """Background loop that watches every user's reminders"""
+    db = get_db()
+    if stop_event is None:
+        stop_event = asyncio.Event()
+
+    while not stop_event.is_set():
+        try:
+            now = datetime.now()
+
+            logger.info("Checking reminders at %02d:%02d on %s", now.hour, now.minute, DAY_NAMES[now.weekday()])
+
+            # One query spans all users; filter_due_reminders is kept as a
+            # defensive post-check
+            candidates = await db.get_due_reminders(now=now)
+            due_reminders = await filter_due_reminders(candidates, now)
+
+            if due_reminders:
+                # Claim last_triggered in the database first; only rows the
+                # conditional update actually claimed get notified, so a
+                # restart can't fire the same reminder twice in a day
+                claimed = await db.mark_reminders_triggered([r.id for r in due_reminders], now)
+
+                if claimed:
+                    # The claim is a write like any other: drop the cached
+                    # lists so the wakeup computation sees the new
+                    # last_triggered instead of rescheduling in the past
+                    invalidate_reminder_cache()
+                    logger.info("Found %s due reminders", len(claimed))
+                    # Here you could send push notifications, emails, etc.
+                    # For now, we'll just log them
+                    for reminder in claimed:
+                        logger.info("Due reminder: %s at %s", reminder.title, reminder.reminder_time)
+
+            # Sleep until the next reminder could fire instead of
+            # polling on a fixed cadence. The heartbeat is capped at
+            # check_interval because the desktop app writes reminders
+            # straight to Supabase without waking us - event or not, we
+            # must never lag a write by more than the old polling cadence
+            await wait_for_next_reminder(db, max_sleep=min(check_interval, MONITOR_REFRESH_SECONDS))
+
+        except Exception as e:
+            logger.error("Error in reminder monitoring: %s", e)
+            await asyncio.sleep(check_interval)
+
+def start_reminder_monitor(check_interval: Optional[int] = None) -> asyncio.Task:
+    """Start (or return the already-running) shared monitor task"""
+    global reminder_monitor_task, reminder_monitor_stop_event
+
+    if reminder_monitor_task and not reminder_monitor_task.done():
+        return reminder_monitor_task
+
+    check_interval = check_interval or Config.REMINDER_CHECK_INTERVAL_SECONDS
+    reminder_monitor_stop_event = asyncio.Event()
+    reminder_monitor_task = asyncio.create_task(
+        monitor_reminders(check_interval, reminder_monitor_stop_event),
+        name="reminder-monitor"
+    )
+    reminder_monitor_task.add_done_callback(_on_monitor_done)
+    logger.info("Reminder monitor started (check_interval=%ss)", check_interval)
+    return reminder_monitor_task
+
+def _on_monitor_done(task: asyncio.Task):
+    """Drop the task reference and surface unexpected monitor crashes"""
+    global reminder_monitor_task, reminder_monitor_stop_event
+
+    if reminder_monitor_task is task:
+        reminder_monitor_task = None
+        reminder_monitor_stop_event = None
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.error("Reminder monitor crashed: %s", exc)
+
+def start_reminder_background_tasks():
+    """Start the log worker and, if enabled, the monitor; called from app
+    startup so they run for the app lifetime, not a request lifetime.
+
+    The monitor is opt-in (REMINDER_MONITOR_AUTOSTART): it claims
+    last_triggered on due reminders but only logs them, and the desktop
+    app skips reminders already triggered today - so auto-claiming would
+    silently swallow the user-facing notifications. Deployments that
+    dispatch notifications from the backend set the flag (or call
+    /monitor/start).
+    """
+    if Config.REMINDER_MONITOR_AUTOSTART:
+        start_reminder_monitor()
+    spawn_background_task(medication_log_worker(), name="medication-log-worker")
+
 @router.post("/monitor/start")
 async def start_reminder_monitoring(
-    background_tasks: BackgroundTasks,
-    user_id: str = "00000000-0000-0000-0000-000000000001",
-    check_interval: int = 60  # seconds
+    check_interval: Optional[int] = Query(None, ge=1, le=600)  # seconds
 ):
-    """Start background reminder monitoring"""
-    global reminder_monitor_running, reminder_monitor_task
-    
-    if reminder_monitor_running:
+    """Start background reminder monitoring for all users"""
+    if reminder_monitor_task and not reminder_monitor_task.done():
         return {"message": "Reminder monitoring is already running"}
-    
-    reminder_monitor_running = True
-    
-    async def monitor_reminders():
-        """Background task to monitor reminders"""
-        db = DatabaseService()
-        
-        while reminder_monitor_running:
-            try:
-                now = datetime.now()
-                current_time = now.strftime("%H:%M")
-                current_day = now.strftime("%A")
-                
-                logger.info(f"Checking reminders at {current_time} on {current_day}")
-                
-                # Get all active reminders
-                reminders = await db.get_reminders(user_id, active_only=True)
-                
-                # Check for due reminders
-                due_reminders = []
-                for reminder in reminders:
-                    if is_reminder_due(reminder, current_time, current_day):
-                        due_reminders.append(reminder)
-                
-                if due_reminders:
-                    logger.info(f"Found {len(due_reminders)} due reminders")
-                    # Here you could send push notifications, emails, etc.
-                    # For now, we'll just log them
-                    for reminder in due_reminders:
-                        logger.info(f"Due reminder: {reminder.title} at {reminder.reminder_time}")
-                        
-                        # Update last_triggered to prevent duplicate notifications
-                        reminder_update = ReminderUpdate(last_triggered=now)
-                        await db.update_reminder(reminder.id, reminder_update)
-                
-                # Wait for next check
-                await asyncio.sleep(check_interval)
-                
-            except Exception as e:
-                logger.error(f"Error in reminder monitoring: {e}")
-                await asyncio.sleep(check_interval)
-    
-    # Start the monitoring task
-    reminder_monitor_task = asyncio.create_task(monitor_reminders())
-    background_tasks.add_task(lambda: reminder_monitor_task)
-    
+
+    check_interval = check_interval or Config.REMINDER_CHECK_INTERVAL_SECONDS
+    start_reminder_monitor(check_interval)
+
     return {
         "message": "Reminder monitoring started",
-        "check_interval": check_interval,
-        "user_id": user_id
+        "check_interval": check_interval
     }
 
 @router.post("/monitor/stop")
 async def stop_reminder_monitoring():
     """Stop background reminder monitoring"""
-    global reminder_monitor_running, reminder_monitor_task
-    
-    if not reminder_monitor_running:
+    if not reminder_monitor_task or reminder_monitor_task.done():
         return {"message": "Reminder monitoring is not running"}
-    
-    reminder_monitor_running = False
-    
-    if reminder_monitor_task:
-        reminder_monitor_task.cancel()
-        reminder_monitor_task = None
-    
+
+    if reminder_monitor_stop_event:
+        reminder_monitor_stop_event.set()
+    reminder_monitor_task.cancel()
+
     return {"message": "Reminder monitoring stopped"}
 
 @router.get("/monitor/status")
 async def get_monitoring_status():
     """Get reminder monitoring status"""
     return {
-        "running": reminder_monitor_running,
-        "task_active": reminder_monitor_task is not None and not reminder_monitor_task.done()
+        "running": reminder_monitor_task is not None and not reminder_monitor_task.done()
     }
 
-def is_reminder_due(reminder: Reminder, current_time: str, current_day: str) -> bool:
-    """Check if a reminder is due based on time and frequency"""
-    
+def next_fire_time(reminder: Reminder, now: datetime) -> Optional[datetime]:
+    """Compute the next moment this reminder could fire, or None if never"""
+    minutes = time_to_minutes(reminder.reminder_time)
+    if minutes is None:
+        return None
+    hour, minute = divmod(minutes, 60)
+
+    # Look up to a week ahead for the next matching day
+    for day_offset in range(8):
+        candidate = (now + timedelta(days=day_offset)).replace(
+            hour=hour, minute=minute, second=0, microsecond=0
+        )
+
+        # Still within the 1-minute tolerance counts as upcoming
+        if candidate < now - timedelta(minutes=1):
+            continue
+
+        if reminder.is_recurring and reminder.days_of_week:
+            if DAY_NAMES[candidate.weekday()] not in days_of_week_set(reminder.days_of_week):
+                continue
+
+        # Already triggered that day; try the next occurrence
+        if reminder.last_triggered and reminder.last_triggered.date() == candidate.date():
+            continue
+
+        if reminder.snooze_until and reminder.snooze_until > candidate:
+            return reminder.snooze_until
+
+        return candidate
+
+    return None
+
+async def wait_for_next_reminder(db: DatabaseService,
+                                 max_sleep: float = MONITOR_REFRESH_SECONDS):
+    """Sleep until the next reminder is due, a reminder changes, or
+    max_sleep elapses - whichever comes first"""
+    # Clear before reading so a write racing with the scan below leaves
+    # the event set and wait() returns immediately instead of sleeping
+    # through a change the scan never saw
+    changed = reminders_changed_event()
+    changed.clear()
+
+    reminders = await get_cached_reminders(db)
+    now = datetime.now()
+
+    next_fire = None
+    for index, reminder in enumerate(reminders, start=1):
+        candidate = next_fire_time(reminder, now)
+        if candidate and (next_fire is None or candidate < next_fire):
+            next_fire = candidate
+        # Don't starve the event loop while scanning a large batch
+        if index % YIELD_EVERY_N_REMINDERS == 0:
+            await asyncio.sleep(0)
+
+    if next_fire:
+        sleep_seconds = min(max((next_fire - now).total_seconds(), 1), max_sleep)
+    else:
+        sleep_seconds = max_sleep
+
+    try:
+        await asyncio.wait_for(changed.wait(), timeout=sleep_seconds)
+        logger.info("Reminders changed, recomputing monitor schedule")
+    except asyncio.TimeoutError:
+        pass
+
+# Memoized time parses; at most 1440 distinct valid "HH:MM" strings exist
+_time_to_minutes_cache: Dict[str, Optional[int]] = {}
+
+def time_to_minutes(value: str) -> Optional[int]:
+    """Convert an "HH:MM" string to minutes since midnight, memoized so
+    each distinct time string is parsed once per process"""
+    if value in _time_to_minutes_cache:
+        return _time_to_minutes_cache[value]
+    try:
+        hour, minute = map(int, value.split(':'))
+        minutes = hour * 60 + minute
+    except (ValueError, AttributeError):
+        minutes = None
+    _time_to_minutes_cache[value] = minutes
+    return minutes
+
+def is_reminder_due(reminder: Reminder, now: datetime, current_minutes: int, current_day: str) -> bool:
+    """Check if a reminder is due based on time and frequency.
+
+    Checks are ordered cheapest and most selective first, so the common
+    not-due reminder is rejected with a flag test and integer compare.
+    """
+
     # Check if reminder is active
     if not reminder.is_active:
         return False
-    
-    # Check if reminder is snoozed
-    if reminder.snooze_until:
-        if reminder.snooze_until > datetime.now():
-            return False
-    
-    # Check if time matches (allowing for 1-minute tolerance)
-    reminder_hour, reminder_minute = map(int, reminder.reminder_time.split(':'))
-    current_hour, current_minute = map(int, current_time.split(':'))
-    
-    # Allow 1-minute tolerance
-    time_diff = abs((current_hour * 60 + current_minute) - (reminder_hour * 60 + reminder_minute))
-    if time_diff > 1:
+
+    # Check if time matches (allowing for 1-minute tolerance); this
+    # rejects nearly everything, so it runs before the datetime checks
+    reminder_minutes = time_to_minutes(reminder.reminder_time)
+    if reminder_minutes is None:
+        return False
+
+    if abs(current_minutes - reminder_minutes) > 1:
         return False
-    
+
     # For recurring reminders, check days of week
     if reminder.is_recurring and reminder.days_of_week:
-        if current_day not in reminder.days_of_week:
+        if current_day not in days_of_week_set(reminder.days_of_week):
             return False
-    
+
     # Check if already triggered today (prevent duplicate notifications)
     if reminder.last_triggered:
-        last_triggered_date = reminder.last_triggered.date()
-        today = datetime.now().date()
-        if last_triggered_date == today:
+        if reminder.last_triggered.date() == now.date():
             return False
-    
+
+    # Check if reminder is snoozed
+    if reminder.snooze_until:
+        if reminder.snooze_until > now:
+            return False
+
     return True
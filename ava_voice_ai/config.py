@@ -42,6 +42,14 @@ class Config:
     MAX_AUDIO_FILES = int(os.getenv("MAX_AUDIO_FILES", "50"))
     AUDIO_RETENTION_HOURS = int(os.getenv("AUDIO_RETENTION_HOURS", "24"))
     
+    # Reminder monitoring settings (clamped to 1-600 seconds)
+    REMINDER_CHECK_INTERVAL_SECONDS = min(max(int(os.getenv("REMINDER_CHECK_INTERVAL_SECONDS", "60")), 1), 600)
+
+    # The backend monitor claims last_triggered on due reminders, which
+    # suppresses the Electron frontend's own notifications, so it stays
+    # off unless a deployment explicitly dispatches from the backend
+    REMINDER_MONITOR_AUTOSTART = os.getenv("REMINDER_MONITOR_AUTOSTART", "false").lower() in ("true", "1", "yes")
+
     # Timezone settings
     DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "UTC")
     
@@ -181,6 +181,8 @@ CREATE INDEX IF NOT EXISTS idx_medication_logs_medication_id ON medication_logs(
 CREATE INDEX IF NOT EXISTS idx_medication_logs_created_at ON medication_logs(created_at);
 CREATE INDEX IF NOT EXISTS idx_reminders_user_id ON reminders(user_id);
 CREATE INDEX IF NOT EXISTS idx_reminders_active ON reminders(is_active);
+CREATE INDEX IF NOT EXISTS idx_reminders_user_active_time ON reminders(user_id, is_active, reminder_time);
+CREATE INDEX IF NOT EXISTS idx_reminders_last_triggered ON reminders(last_triggered);
 CREATE INDEX IF NOT EXISTS idx_emergency_contacts_user_id ON emergency_contacts(user_id);
 CREATE INDEX IF NOT EXISTS idx_health_records_user_id ON health_records(user_id);
 CREATE INDEX IF NOT EXISTS idx_health_records_type ON health_records(record_type);
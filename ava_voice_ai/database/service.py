@@ -28,6 +28,23 @@ from database.models import *
 
 logger = logging.getLogger(__name__)
 
+# Day names indexed by datetime.weekday(); cheaper than strftime("%A")
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+def due_time_window(now: datetime) -> tuple:
+    """1-minute tolerance window around now as ("HH:MM", "HH:MM") strings.
+
+    reminder_time is zero-padded text, so the bounds compare correctly
+    lexically; when the window crosses midnight the low bound sorts above
+    the high bound and the caller must OR the two comparisons instead of
+    ANDing them.
+    """
+    window_start = now - timedelta(minutes=1)
+    window_end = now + timedelta(minutes=1)
+    time_lo = f"{window_start.hour:02d}:{window_start.minute:02d}"
+    time_hi = f"{window_end.hour:02d}:{window_end.minute:02d}"
+    return time_lo, time_hi
+
 class DatabaseService:
     """Database service for interacting with Supabase"""
     
@@ -55,7 +72,7 @@ class DatabaseService:
                 logger.warning("Database not configured. Using fallback mode.")
                 self.is_connected = False
         except Exception as e:
-            logger.error(f"Failed to initialize database connection: {e}")
+            logger.error("Failed to initialize database connection: %s", e)
             self.is_connected = False
     
     def _test_connection(self):
@@ -68,7 +85,7 @@ class DatabaseService:
             result = self.client.table('users').select('id').limit(1).execute()
             logger.info("Database connection test successful")
         except Exception as e:
-            logger.error(f"Database connection test failed: {e}")
+            logger.error("Database connection test failed: %s", e)
             raise
     
     def health_check(self) -> Dict[str, Any]:
@@ -109,7 +126,7 @@ class DatabaseService:
             if result.data:
                 return User(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating user: {e}")
+            logger.error("Error creating user: %s", e)
         return None
     
     async def get_user(self, user_id: str) -> Optional[User]:
@@ -122,7 +139,7 @@ class DatabaseService:
             if result.data:
                 return User(**result.data[0])
         except Exception as e:
-            logger.error(f"Error getting user: {e}")
+            logger.error("Error getting user: %s", e)
         return None
     
     async def get_user_by_email(self, email: str) -> Optional[User]:
@@ -135,7 +152,7 @@ class DatabaseService:
             if result.data:
                 return User(**result.data[0])
         except Exception as e:
-            logger.error(f"Error getting user by email: {e}")
+            logger.error("Error getting user by email: %s", e)
         return None
     
     async def update_user(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
@@ -151,7 +168,7 @@ class DatabaseService:
             if result.data:
                 return User(**result.data[0])
         except Exception as e:
-            logger.error(f"Error updating user: {e}")
+            logger.error("Error updating user: %s", e)
         return None
     
     # Medication Operations
@@ -170,7 +187,7 @@ class DatabaseService:
             if result.data:
                 return Medication(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating medication: {e}")
+            logger.error("Error creating medication: %s", e)
         return None
     
     async def get_medications(self, user_id: str, active_only: bool = True) -> List[Medication]:
@@ -186,7 +203,7 @@ class DatabaseService:
             result = query.execute()
             return [Medication(**med) for med in result.data]
         except Exception as e:
-            logger.error(f"Error getting medications: {e}")
+            logger.error("Error getting medications: %s", e)
         return []
     
     async def get_medication(self, medication_id: str) -> Optional[Medication]:
@@ -199,7 +216,7 @@ class DatabaseService:
             if result.data:
                 return Medication(**result.data[0])
         except Exception as e:
-            logger.error(f"Error getting medication: {e}")
+            logger.error("Error getting medication: %s", e)
         return None
     
     async def update_medication(self, medication_id: str, medication_data: MedicationUpdate) -> Optional[Medication]:
@@ -215,7 +232,7 @@ class DatabaseService:
             if result.data:
                 return Medication(**result.data[0])
         except Exception as e:
-            logger.error(f"Error updating medication: {e}")
+            logger.error("Error updating medication: %s", e)
         return None
     
     async def delete_medication(self, medication_id: str) -> bool:
@@ -227,9 +244,9 @@ class DatabaseService:
             # First, delete all associated reminders for this medication
             try:
                 reminder_result = self.client.table('reminders').delete().eq('medication_id', medication_id).execute()
-                logger.info(f"Deleted {len(reminder_result.data) if reminder_result.data else 0} reminders for medication {medication_id}")
+                logger.info("Deleted %s reminders for medication %s", len(reminder_result.data) if reminder_result.data else 0, medication_id)
             except Exception as reminder_error:
-                logger.warning(f"Error deleting medication reminders: {reminder_error}")
+                logger.warning("Error deleting medication reminders: %s", reminder_error)
                 # Continue with medication deletion even if reminder deletion fails
             
             # Then hard delete the medication itself
@@ -237,13 +254,13 @@ class DatabaseService:
             success = bool(result.data)
             
             if success:
-                logger.info(f"Successfully deleted medication {medication_id} and associated reminders")
+                logger.info("Successfully deleted medication %s and associated reminders", medication_id)
             else:
-                logger.warning(f"No medication found with ID {medication_id}")
+                logger.warning("No medication found with ID %s", medication_id)
                 
             return success
         except Exception as e:
-            logger.error(f"Error deleting medication: {e}")
+            logger.error("Error deleting medication: %s", e)
         return False
     
     # Medication Log Operations
@@ -261,7 +278,7 @@ class DatabaseService:
             if result.data:
                 return MedicationLog(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating medication log: {e}")
+            logger.error("Error creating medication log: %s", e)
         return None
     
     async def get_medication_logs(self, user_id: str, medication_id: Optional[str] = None, 
@@ -281,7 +298,7 @@ class DatabaseService:
             result = query.order('created_at', desc=True).execute()
             return [MedicationLog(**log) for log in result.data]
         except Exception as e:
-            logger.error(f"Error getting medication logs: {e}")
+            logger.error("Error getting medication logs: %s", e)
         return []
     
     # Reminder Operations
@@ -300,25 +317,82 @@ class DatabaseService:
             if result.data:
                 return Reminder(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating reminder: {e}")
+            logger.error("Error creating reminder: %s", e)
         return None
     
-    async def get_reminders(self, user_id: str, active_only: bool = True) -> List[Reminder]:
-        """Get user reminders"""
+    async def get_reminders(self, user_id: Optional[str], active_only: bool = True,
+                            limit: Optional[int] = None, offset: int = 0,
+                            since: Optional[datetime] = None) -> List[Reminder]:
+        """Get reminders, optionally a single page; user_id=None means all
+        users, since filters to reminders created at or after that moment"""
         if not self.is_connected:
             return []
-        
+
         try:
-            query = self.client.table('reminders').select('*').eq('user_id', user_id)
+            query = self.client.table('reminders').select('*')
+            if user_id is not None:
+                query = query.eq('user_id', user_id)
             if active_only:
                 query = query.eq('is_active', True)
-            
+            if since is not None:
+                query = query.gte('created_at', since.isoformat())
+
+            if limit is not None:
+                # Stable ordering so pages don't overlap between requests;
+                # created_at is unique per row, unlike reminder_time
+                query = query.order('created_at', desc=True).range(offset, offset + limit - 1)
+
             result = query.execute()
             return [Reminder(**reminder) for reminder in result.data]
         except Exception as e:
-            logger.error(f"Error getting reminders: {e}")
+            logger.error("Error getting reminders: %s", e)
         return []
     
+    async def get_due_reminders(self, user_id: Optional[str] = None,
+                                now: Optional[datetime] = None) -> List[Reminder]:
+        """Get reminders that are due right now, filtered database-side.
+
+        Pushes the time window, day-of-week, snooze and already-triggered
+        checks into the query so only the handful of due reminders are
+        fetched and deserialized, instead of every active reminder.
+        With user_id=None the query spans all users.
+        """
+        if not self.is_connected:
+            return []
+
+        try:
+            if now is None:
+                now = datetime.now()
+
+            current_day = DAY_NAMES[now.weekday()]
+            today_start = datetime(now.year, now.month, now.day)
+
+            time_lo, time_hi = due_time_window(now)
+
+            query = self.client.table('reminders').select('*')
+            if user_id is not None:
+                query = query.eq('user_id', user_id)
+            query = query.eq('is_active', True)
+
+            if time_lo <= time_hi:
+                query = query.gte('reminder_time', time_lo).lte('reminder_time', time_hi)
+            else:
+                # Window wraps midnight
+                query = query.or_(f'reminder_time.gte.{time_lo},reminder_time.lte.{time_hi}')
+
+            query = query.or_(f'snooze_until.is.null,snooze_until.lte.{now.isoformat()}')
+            query = query.or_(
+                'is_recurring.eq.false,days_of_week.is.null,'
+                'days_of_week.cs.{' + current_day + '}'
+            )
+            query = query.or_(f'last_triggered.is.null,last_triggered.lt.{today_start.isoformat()}')
+
+            result = query.execute()
+            return [Reminder(**reminder) for reminder in result.data]
+        except Exception as e:
+            logger.error("Error getting due reminders: %s", e)
+        return []
+
     async def update_reminder(self, reminder_id: str, reminder_data: ReminderUpdate) -> Optional[Reminder]:
         """Update reminder"""
         if not self.is_connected:
@@ -332,9 +406,40 @@ class DatabaseService:
             if result.data:
                 return Reminder(**result.data[0])
         except Exception as e:
-            logger.error(f"Error updating reminder: {e}")
+            logger.error("Error updating reminder: %s", e)
         return None
     
+    async def mark_reminders_triggered(self, reminder_ids: List[str],
+                                       triggered_at: Optional[datetime] = None) -> List[Reminder]:
+        """Claim a batch of reminders as triggered in a single update.
+
+        The update is conditional on the reminder not having fired today,
+        so concurrent monitors or a restart can't double-trigger the same
+        reminder; only the rows actually claimed are returned.
+        """
+        if not self.is_connected or not reminder_ids:
+            return []
+
+        try:
+            if triggered_at is None:
+                triggered_at = datetime.now()
+
+            today_start = datetime(triggered_at.year, triggered_at.month, triggered_at.day)
+            data = {
+                'last_triggered': triggered_at.isoformat(),
+                'updated_at': datetime.now().isoformat()
+            }
+            result = (
+                self.client.table('reminders').update(data)
+                .in_('id', reminder_ids)
+                .or_(f'last_triggered.is.null,last_triggered.lt.{today_start.isoformat()}')
+                .execute()
+            )
+            return [Reminder(**reminder) for reminder in result.data]
+        except Exception as e:
+            logger.error("Error marking reminders triggered: %s", e)
+        return []
+
     async def delete_reminder(self, reminder_id: str) -> bool:
         """Soft delete reminder"""
         if not self.is_connected:
@@ -348,7 +453,7 @@ class DatabaseService:
             result = self.client.table('reminders').update(data).eq('id', reminder_id).execute()
             return bool(result.data)
         except Exception as e:
-            logger.error(f"Error deleting reminder: {e}")
+            logger.error("Error deleting reminder: %s", e)
         return False
     
     # Emergency Contact Operations
@@ -367,7 +472,7 @@ class DatabaseService:
             if result.data:
                 return EmergencyContact(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating emergency contact: {e}")
+            logger.error("Error creating emergency contact: %s", e)
         return None
     
     async def get_emergency_contacts(self, user_id: str) -> List[EmergencyContact]:
@@ -379,7 +484,7 @@ class DatabaseService:
             result = self.client.table('emergency_contacts').select('*').eq('user_id', user_id).execute()
             return [EmergencyContact(**contact) for contact in result.data]
         except Exception as e:
-            logger.error(f"Error getting emergency contacts: {e}")
+            logger.error("Error getting emergency contacts: %s", e)
         return []
     
     async def update_emergency_contact(self, contact_id: str, contact_data: EmergencyContactUpdate) -> Optional[EmergencyContact]:
@@ -395,7 +500,7 @@ class DatabaseService:
             if result.data:
                 return EmergencyContact(**result.data[0])
         except Exception as e:
-            logger.error(f"Error updating emergency contact: {e}")
+            logger.error("Error updating emergency contact: %s", e)
         return None
     
     async def delete_emergency_contact(self, contact_id: str) -> bool:
@@ -407,7 +512,7 @@ class DatabaseService:
             result = self.client.table('emergency_contacts').delete().eq('id', contact_id).execute()
             return bool(result.data)
         except Exception as e:
-            logger.error(f"Error deleting emergency contact: {e}")
+            logger.error("Error deleting emergency contact: %s", e)
         return False
     
     # Health Record Operations
@@ -427,7 +532,7 @@ class DatabaseService:
             if result.data:
                 return HealthRecord(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating health record: {e}")
+            logger.error("Error creating health record: %s", e)
         return None
     
     async def get_health_records(self, user_id: str, record_type: Optional[str] = None, 
@@ -447,7 +552,7 @@ class DatabaseService:
             result = query.order('recorded_at', desc=True).execute()
             return [HealthRecord(**record) for record in result.data]
         except Exception as e:
-            logger.error(f"Error getting health records: {e}")
+            logger.error("Error getting health records: %s", e)
         return []
     
     # Symptom Check Operations
@@ -467,7 +572,7 @@ class DatabaseService:
             if result.data:
                 return SymptomCheck(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating symptom check: {e}")
+            logger.error("Error creating symptom check: %s", e)
         return None
     
     async def get_symptom_checks(self, user_id: str, days: int = 30) -> List[SymptomCheck]:
@@ -483,7 +588,7 @@ class DatabaseService:
             result = query.order('checked_at', desc=True).execute()
             return [SymptomCheck(**check) for check in result.data]
         except Exception as e:
-            logger.error(f"Error getting symptom checks: {e}")
+            logger.error("Error getting symptom checks: %s", e)
         return []
     
     # Chat Session Operations
@@ -503,7 +608,7 @@ class DatabaseService:
             if result.data:
                 return ChatSession(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating chat session: {e}")
+            logger.error("Error creating chat session: %s", e)
         return None
     
     async def create_chat_message(self, message_data: ChatMessageCreate) -> Optional[ChatMessage]:
@@ -528,7 +633,7 @@ class DatabaseService:
                 
                 return ChatMessage(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating chat message: {e}")
+            logger.error("Error creating chat message: %s", e)
         return None
     
     # Audio File Operations
@@ -546,7 +651,7 @@ class DatabaseService:
             if result.data:
                 return AudioFile(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating audio file: {e}")
+            logger.error("Error creating audio file: %s", e)
         return None
     
     async def get_audio_files(self, user_id: str, active_only: bool = True) -> List[AudioFile]:
@@ -562,7 +667,7 @@ class DatabaseService:
             result = query.order('created_at', desc=True).execute()
             return [AudioFile(**audio) for audio in result.data]
         except Exception as e:
-            logger.error(f"Error getting audio files: {e}")
+            logger.error("Error getting audio files: %s", e)
         return []
     
     # Health Tips Operations
@@ -579,7 +684,7 @@ class DatabaseService:
             result = query.order('priority', desc=True).limit(limit).execute()
             return [HealthTip(**tip) for tip in result.data]
         except Exception as e:
-            logger.error(f"Error getting health tips: {e}")
+            logger.error("Error getting health tips: %s", e)
         return []
     
     async def create_user_health_tip_interaction(self, interaction_data: UserHealthTipCreate) -> Optional[UserHealthTip]:
@@ -598,7 +703,7 @@ class DatabaseService:
             if result.data:
                 return UserHealthTip(**result.data[0])
         except Exception as e:
-            logger.error(f"Error creating user health tip interaction: {e}")
+            logger.error("Error creating user health tip interaction: %s", e)
         return None
 
 # Global database instance
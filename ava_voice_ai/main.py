@@ -48,6 +48,7 @@ from database import (
     UserHealthTip, UserHealthTipCreate,
     APIResponse, PaginatedResponse
 )
+from api.reminders import notify_reminders_changed, start_reminder_background_tasks
 
 # Initialize services
 voice_input: Optional[VoiceInput] = None
@@ -102,7 +103,14 @@ async def lifespan(app: FastAPI):
             print("WARNING: Murf TTS connection failed")
         else:
             print("SUCCESS: Murf TTS initialized")
-            
+
+        # Start reminder background tasks for the app lifetime
+        start_reminder_background_tasks()
+        if Config.REMINDER_MONITOR_AUTOSTART:
+            print("SUCCESS: Reminder monitor started")
+        else:
+            print("SUCCESS: Reminder background tasks started (monitor off)")
+
         print("API server ready!")
         
     except Exception as e:
@@ -438,6 +446,7 @@ async def add_medication(medication: LegacyMedication):
                         reminder_type="medication"
                     )
                     await db_service.create_reminder(reminder_data)
+                    notify_reminders_changed(current_user_id)
                 except Exception as reminder_error:
                     logger.warning(f"Failed to create automatic reminder: {reminder_error}")
                 
@@ -516,6 +525,7 @@ async def update_medication(medication_id: str, medication: LegacyMedication):
                             )
                             await db_service.update_reminder(reminder.id, reminder_update)
                             logger.info(f"Updated reminder for medication {medication.name} with new time {medication.time}")
+                    notify_reminders_changed(current_user_id)
                 except Exception as reminder_error:
                     logger.warning(f"Failed to update medication reminders: {reminder_error}")
                 
@@ -571,6 +581,8 @@ async def delete_medication(medication_id: str):
             # Delete the medication (soft delete)
             success = await db_service.delete_medication(medication_id)
             if success:
+                # Associated reminders go away with the medication
+                notify_reminders_changed(current_user_id)
                 return APIResponse(
                     success=True,
                     message="Medication deleted successfully"
@@ -661,6 +673,7 @@ async def add_reminder(reminder: LegacyReminder):
             )
             new_reminder = await db_service.create_reminder(reminder_data)
             if new_reminder:
+                notify_reminders_changed(current_user_id)
                 return APIResponse(
                     success=True,
                     data={"reminder": new_reminder.dict()},
@@ -697,6 +710,7 @@ async def update_reminder(reminder_id: str, reminder: LegacyReminder):
             )
             updated_reminder = await db_service.update_reminder(reminder_id, reminder_data)
             if updated_reminder:
+                notify_reminders_changed(current_user_id)
                 return APIResponse(
                     success=True,
                     data={"reminder": updated_reminder.dict()},
@@ -739,6 +753,7 @@ async def delete_reminder(reminder_id: str):
         if db_service.is_connected:
             success = await db_service.delete_reminder(reminder_id)
             if success:
+                notify_reminders_changed(current_user_id)
                 return APIResponse(
                     success=True,
                     message="Reminder deleted successfully"
@@ -811,8 +826,9 @@ async def snooze_reminder(reminder_id: str, minutes: int = 5):
             
             reminder_update = ReminderUpdate(snooze_until=snooze_until)
             updated_reminder = await db_service.update_reminder(reminder_id, reminder_update)
-            
+
             if updated_reminder:
+                notify_reminders_changed(current_user_id)
                 return APIResponse(
                     success=True,
                     data={"reminder": updated_reminder},
@@ -847,7 +863,8 @@ async def complete_reminder(reminder_id: str, medication_id: Optional[str] = Non
                     success=False,
                     error="Reminder not found"
                 )
-            
+            notify_reminders_changed(current_user_id)
+
             # If it's a medication reminder, log it
             if medication_id:
                 try:
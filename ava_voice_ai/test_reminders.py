@@ -0,0 +1,150 @@
+"""
+Tests for the reminder scheduling helpers (run with pytest)
+"""
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from api.reminders import is_reminder_due, next_fire_time, time_to_minutes
+from database.models import Reminder
+from database.service import DAY_NAMES, due_time_window
+
+
+def make_reminder(**overrides):
+    """A daily 08:30 reminder; override fields per test"""
+    fields = {
+        "user_id": "00000000-0000-0000-0000-000000000001",
+        "title": "Take medication",
+        "reminder_time": "08:30",
+        "is_recurring": True,
+        "days_of_week": None,
+        "is_active": True,
+        "last_triggered": None,
+        "snooze_until": None,
+    }
+    fields.update(overrides)
+    return Reminder(**fields)
+
+
+# --- due_time_window ---
+
+def test_due_time_window_normal():
+    lo, hi = due_time_window(datetime(2026, 8, 26, 8, 30))
+    assert (lo, hi) == ("08:29", "08:31")
+    assert lo <= hi
+
+
+def test_due_time_window_zero_padded():
+    lo, hi = due_time_window(datetime(2026, 8, 26, 9, 5))
+    assert (lo, hi) == ("09:04", "09:06")
+
+
+def test_due_time_window_wraps_past_midnight():
+    # Just after midnight the low bound is yesterday's 23:59 and sorts
+    # above the high bound, which is what triggers the OR branch in
+    # get_due_reminders
+    lo, hi = due_time_window(datetime(2026, 8, 26, 0, 0))
+    assert (lo, hi) == ("23:59", "00:01")
+    assert lo > hi
+
+
+def test_due_time_window_wraps_before_midnight():
+    lo, hi = due_time_window(datetime(2026, 8, 26, 23, 59))
+    assert (lo, hi) == ("23:58", "00:00")
+    assert lo > hi
+
+
+# --- time_to_minutes ---
+
+def test_time_to_minutes():
+    assert time_to_minutes("00:00") == 0
+    assert time_to_minutes("08:30") == 510
+    assert time_to_minutes("23:59") == 1439
+
+
+def test_time_to_minutes_invalid():
+    assert time_to_minutes("not a time") is None
+    assert time_to_minutes("") is None
+
+
+# --- next_fire_time ---
+
+def test_next_fire_time_later_today():
+    now = datetime(2026, 8, 26, 7, 0)  # Wednesday
+    reminder = make_reminder()
+    assert next_fire_time(reminder, now) == datetime(2026, 8, 26, 8, 30)
+
+
+def test_next_fire_time_rolls_to_tomorrow():
+    now = datetime(2026, 8, 26, 9, 0)
+    reminder = make_reminder()
+    assert next_fire_time(reminder, now) == datetime(2026, 8, 27, 8, 30)
+
+
+def test_next_fire_time_within_tolerance_counts_as_now():
+    # One minute past is still inside the due window, not tomorrow
+    now = datetime(2026, 8, 26, 8, 31)
+    reminder = make_reminder()
+    assert next_fire_time(reminder, now) == datetime(2026, 8, 26, 8, 30)
+
+
+def test_next_fire_time_respects_days_of_week():
+    now = datetime(2026, 8, 26, 7, 0)  # Wednesday
+    reminder = make_reminder(days_of_week=["Friday"])
+    assert next_fire_time(reminder, now) == datetime(2026, 8, 28, 8, 30)
+
+
+def test_next_fire_time_skips_day_already_triggered():
+    now = datetime(2026, 8, 26, 7, 0)
+    reminder = make_reminder(last_triggered=datetime(2026, 8, 26, 8, 30))
+    assert next_fire_time(reminder, now) == datetime(2026, 8, 27, 8, 30)
+
+
+def test_next_fire_time_snooze_overrides_schedule():
+    now = datetime(2026, 8, 26, 8, 0)
+    snooze_until = datetime(2026, 8, 26, 9, 15)
+    reminder = make_reminder(snooze_until=snooze_until)
+    assert next_fire_time(reminder, now) == snooze_until
+
+
+def test_next_fire_time_invalid_time_is_never():
+    now = datetime(2026, 8, 26, 7, 0)
+    reminder = make_reminder(reminder_time="soon")
+    assert next_fire_time(reminder, now) is None
+
+
+# --- is_reminder_due ---
+
+def due_args(now):
+    return now, now.hour * 60 + now.minute, DAY_NAMES[now.weekday()]
+
+
+def test_is_reminder_due_at_time():
+    now = datetime(2026, 8, 26, 8, 30)
+    assert is_reminder_due(make_reminder(), *due_args(now))
+
+
+def test_is_reminder_due_tolerates_one_minute():
+    assert is_reminder_due(make_reminder(), *due_args(datetime(2026, 8, 26, 8, 29)))
+    assert is_reminder_due(make_reminder(), *due_args(datetime(2026, 8, 26, 8, 31)))
+    assert not is_reminder_due(make_reminder(), *due_args(datetime(2026, 8, 26, 8, 32)))
+
+
+def test_is_reminder_due_rejections():
+    now = datetime(2026, 8, 26, 8, 30)  # Wednesday
+    assert not is_reminder_due(make_reminder(is_active=False), *due_args(now))
+    assert not is_reminder_due(make_reminder(days_of_week=["Friday"]), *due_args(now))
+    assert not is_reminder_due(
+        make_reminder(last_triggered=datetime(2026, 8, 26, 8, 29)), *due_args(now))
+    assert not is_reminder_due(
+        make_reminder(snooze_until=now + timedelta(minutes=10)), *due_args(now))
+
+
+def test_is_reminder_due_after_snooze_expires():
+    now = datetime(2026, 8, 26, 8, 30)
+    reminder = make_reminder(snooze_until=now - timedelta(minutes=5))
+    assert is_reminder_due(reminder, *due_args(now))